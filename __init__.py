@@ -4,9 +4,19 @@ Study Buddy AI
 A helpful AI agent for students built with Google ADK.
 """
 
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "Elijah"
 
-from .agents.agent import StudyBuddyAgent
-
 __all__ = ["StudyBuddyAgent"]
+
+
+def __getattr__(name: str) -> Any:
+    # Deferred so importing the package (e.g. for the tools modules or
+    # the test suite) does not pull in the full agent stack.
+    if name == "StudyBuddyAgent":
+        from .agents.agent import StudyBuddyAgent
+
+        return StudyBuddyAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
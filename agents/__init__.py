@@ -0,0 +1,14 @@
+"""
+Agents Package
+
+Contains the agents that make up the study buddy system.
+"""
+
+from .agent import StudyBuddyAgent, root_agent
+from .plan_compiler import compile_plan
+
+__all__ = [
+    "StudyBuddyAgent",
+    "compile_plan",
+    "root_agent",
+]
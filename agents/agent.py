@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Study Buddy Agent
+
+Main agent that orchestrates the full learning process: getting to know the
+student, researching the subject, creating a study plan, and running the
+teach/quiz/assess loop for each section.
+"""
+
+from google.adk.agents import Agent
+from google.adk.models.lite_llm import LiteLlm
+
+from ..tools.root_agent_tools import (
+    check_understanding,
+    check_understanding_batch,
+    create_study_sections,
+    get_student_info,
+    quiz_section,
+    quiz_section_batch,
+    research_subject,
+    run_section,
+    run_sections,
+    teach_section,
+)
+
+ROOT_INSTRUCTIONS = """
+You are Study Buddy, a systematic AI tutor that helps students master their
+exam subjects. Follow this flow:
+
+Step 1: Get to know the student. Use get_student_info to collect their grade
+level, subject, and exam timeline.
+
+Step 2: Research the subject. Use research_subject to identify the key
+concepts to cover for their grade level.
+
+Step 3: Create the study plan. Use create_study_sections to divide the key
+concepts into logical, sequential sections.
+
+Step 4: For each section in order:
+  4a. Teach the section with teach_section, using clear explanations and
+      examples appropriate for the student's grade level.
+  4b. Quiz the student with quiz_section to test their understanding.
+  4c. Assess their answers with check_understanding.
+  4d. If understanding is below the mastery threshold, re-teach the weak
+      areas before moving to the next section. Only advance once the
+      student demonstrates mastery.
+
+When the teach and quiz steps for a section are independent, dispatch them
+together with run_section (or run_sections for a whole plan) instead of one
+at a time.
+
+Be encouraging and patient. Adapt your pacing to the student.
+"""
+
+root_agent = Agent(
+    name="study_buddy",
+    model=LiteLlm(model="openai/gpt-4o-mini"),
+    description="Systematic AI tutor that teaches, quizzes, and assesses students",
+    instruction=ROOT_INSTRUCTIONS,
+    tools=[
+        get_student_info,
+        research_subject,
+        create_study_sections,
+        teach_section,
+        quiz_section,
+        check_understanding,
+        quiz_section_batch,
+        check_understanding_batch,
+        run_section,
+        run_sections,
+    ],
+)
+
+# Public alias used by the package entry point.
+StudyBuddyAgent = root_agent
+
+__all__ = ["ROOT_INSTRUCTIONS", "StudyBuddyAgent", "root_agent"]
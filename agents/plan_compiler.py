@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Plan Compiler
+
+Compiles the fixed teaching flow described in ROOT_INSTRUCTIONS into a
+single executable coroutine. The flow is a deterministic DAG (intake ->
+research -> plan -> per-section teach/quiz/assess), so re-deciding each
+step with an LLM round-trip per tool call buys nothing; the compiled plan
+calls the tools directly and leaves the LLM for the teaching content
+itself.
+
+The compiled plan is validated against the tool signatures registered on
+the agent, so signature drift is caught at compile time rather than as a
+tool-misuse error mid-session. Tool calls are dispatched through the
+solidified skill registry (tools.skills.call_skill) with per-result
+validation, so a malformed cached result raises instead of flowing
+onward. When a precondition fails (e.g. the student profile is
+incomplete), the plan bails out and defers to the interactive agent
+instead of guessing.
+"""
+
+import inspect
+from typing import Any, Awaitable, Callable, Optional
+
+from ..tools.root_agent_tools import run_sections
+from ..tools.skills import call_skill
+from .agent import root_agent
+
+# Parameter names the compiled plan passes to each tool. Validated against
+# the live signatures on the agent so the plan cannot silently drift from
+# the tools it inlines.
+_EXPECTED_SIGNATURES = {
+    "get_student_info": ("grade_level", "subject", "exam_timeline"),
+    "research_subject": ("subject", "grade_level"),
+    "create_study_sections": ("subject", "key_concepts", "grade_level"),
+    "teach_section": ("section_title", "subject", "grade_level"),
+    "quiz_section": ("section_title", "subject"),
+    "check_understanding": ("quiz_results",),
+}
+
+
+def _validate_tool_signatures(agent: Any) -> None:
+    """
+    Check that every tool the compiled plan inlines is registered on the
+    agent with the parameters the plan was compiled against.
+
+    Raises:
+        RuntimeError: If a tool is missing or its signature has drifted
+    """
+    registered = {getattr(tool, "__name__", str(tool)): tool for tool in agent.tools}
+
+    for name, expected_params in _EXPECTED_SIGNATURES.items():
+        tool = registered.get(name)
+        if tool is None:
+            raise RuntimeError(f"Compiled plan requires tool '{name}', not registered")
+        actual_params = tuple(inspect.signature(tool).parameters)
+        if actual_params[: len(expected_params)] != expected_params:
+            raise RuntimeError(
+                f"Tool '{name}' signature drifted: expected {expected_params}, "
+                f"got {actual_params}"
+            )
+
+
+def compile_plan(
+    agent: Any = root_agent,
+) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """
+    Compile the ROOT_INSTRUCTIONS flow into one executable coroutine.
+
+    Args:
+        agent: The agent whose registered tools the plan is validated
+            against (defaults to root_agent)
+
+    Returns:
+        Coroutine function running the full study flow for one student.
+        It takes (grade_level, subject, exam_timeline) plus an optional
+        answers_by_section mapping of section number to the quiz_results
+        dict accepted by check_understanding; sections without submitted
+        answers are reported with a pending assessment rather than a
+        verdict. The result includes "fallback_to_agent": True when a
+        precondition fails and the interactive agent should take over
+    """
+    _validate_tool_signatures(agent)
+
+    async def run_study_plan(
+        grade_level: str,
+        subject: str,
+        exam_timeline: str,
+        answers_by_section: Optional[dict[int, dict[str, Any]]] = None,
+    ) -> dict[str, Any]:
+        profile = await call_skill(
+            "get_student_info",
+            grade_level,
+            subject,
+            exam_timeline,
+            validate=lambda result: "student_profile" in result,
+        )
+        if not profile.get("profile_complete"):
+            return {
+                "fallback_to_agent": True,
+                "reason": "Student profile incomplete; deferring to the agent",
+            }
+
+        research = await call_skill(
+            "research_subject",
+            subject,
+            grade_level,
+            validate=lambda result: result.get("research_complete", False),
+        )
+        plan = await call_skill(
+            "create_study_sections",
+            subject,
+            research["key_concepts"],
+            grade_level,
+            validate=lambda result: result.get("plan_created", False),
+        )
+        prepared_sections = await run_sections(plan["sections"], subject, grade_level)
+
+        section_results = []
+        for prepared in prepared_sections:
+            quiz_results = (answers_by_section or {}).get(prepared["section_number"])
+            if quiz_results is None:
+                # No answers submitted for this section yet; assessing the
+                # quiz definition would only fabricate a verdict.
+                assessment = None
+                assessment_pending = True
+            else:
+                assessment = await call_skill("check_understanding", quiz_results)
+                assessment_pending = assessment["assessment_pending"]
+            section_results.append(
+                {
+                    "section_number": prepared["section_number"],
+                    "taught": prepared["taught"],
+                    "quiz": prepared["quiz"],
+                    "assessment": assessment,
+                    "assessment_pending": assessment_pending,
+                }
+            )
+
+        return {
+            "student_profile": profile["student_profile"],
+            "study_plan": plan,
+            "section_results": section_results,
+            "plan_executed": True,
+        }
+
+    return run_study_plan
+
+
+__all__ = ["compile_plan"]
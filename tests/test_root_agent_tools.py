@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the root agent tools: LP hour allocation and quiz assessment.
+"""
+
+import asyncio
+
+import pytest
+
+from tools.root_agent_tools import (
+    _allocate_study_hours,
+    _hash_answer,
+    check_understanding,
+    create_study_sections,
+)
+
+
+def test_allocate_uniform_knowledge_splits_evenly():
+    assert _allocate_study_hours((0.5,) * 5, 20.0) == [4.0] * 5
+
+
+def test_allocate_infeasible_budget_falls_back_to_proportional():
+    assert _allocate_study_hours((0.5,) * 5, 2.0) == [0.4] * 5
+
+
+def test_allocate_zero_budget_allocates_nothing():
+    assert _allocate_study_hours((0.5,) * 3, 0.0) == [0.0] * 3
+
+
+def test_allocate_weakest_sections_get_hours_first():
+    hours = _allocate_study_hours((0.9, 0.3, 0.5), 10.0)
+    assert hours[1] == max(hours)
+    assert sum(hours) <= 10.0
+
+
+def test_allocate_rounding_never_exceeds_budget():
+    assert sum(_allocate_study_hours((0.33,) * 3, 5.0)) <= 5.0
+    assert sum(_allocate_study_hours((0.5,) * 12, 20.0)) <= 20.0
+    assert sum(_allocate_study_hours((0.33,) * 7, 3.0)) <= 3.0
+
+
+def test_allocate_ample_budget_hits_mastery_targets():
+    assert _allocate_study_hours((0.5, 1.0), 100.0) == [8.0, 4.0]
+
+
+def test_create_study_sections_rejects_mismatched_knowledge_levels():
+    with pytest.raises(ValueError):
+        asyncio.run(
+            create_study_sections(
+                "Biology", ["a", "b", "c"], "9th grade", knowledge_levels=[0.9]
+            )
+        )
+
+
+def test_create_study_sections_never_returns_negative_hours():
+    plan = asyncio.run(
+        create_study_sections(
+            "Biology", ["a", "b", "c", "d", "e"], "9th grade", total_study_hours=2.0
+        )
+    )
+    assert plan["total_sections"] == 5
+    assert all(section["estimated_hours"] >= 0 for section in plan["sections"])
+
+
+def test_check_understanding_scores_per_question_path():
+    result = asyncio.run(check_understanding({"per_question": [1.0, 0.5, 1.0]}))
+    assert result["weak_areas"] == [1]
+    assert not result["assessment_pending"]
+    assert result["ready_to_advance"]
+
+
+def test_check_understanding_rejects_mismatched_weights():
+    with pytest.raises(ValueError):
+        asyncio.run(
+            check_understanding({"per_question": [0.0] * 8, "weights": [1.0, 1.0]})
+        )
+
+
+def test_check_understanding_reports_weak_areas_past_64_questions():
+    result = asyncio.run(check_understanding({"per_question": [0.0] * 70}))
+    assert result["weak_areas"] == list(range(70))
+
+
+def test_check_understanding_grades_structured_answers_by_hash():
+    result = asyncio.run(
+        check_understanding(
+            {
+                "answers": [
+                    {
+                        "type": "mcq",
+                        "answer": " Right ",
+                        "answer_hash": _hash_answer("right"),
+                    },
+                    {
+                        "type": "mcq",
+                        "answer": "wrong",
+                        "answer_hash": _hash_answer("right"),
+                    },
+                ]
+            }
+        )
+    )
+    assert result["understanding_level"] == 0.5
+    assert result["weak_areas"] == [1]
+    assert not result["assessment_pending"]
+
+
+def test_check_understanding_pends_verdict_on_ungraded_text():
+    result = asyncio.run(
+        check_understanding({"answers": [{"type": "text", "question": "Explain"}]})
+    )
+    assert result["assessment_pending"]
+    assert not result["ready_to_advance"]
+    assert result["understanding_level"] is None
+
+
+def test_check_understanding_weak_areas_index_submission_order():
+    result = asyncio.run(
+        check_understanding(
+            {
+                "answers": [
+                    {"type": "text", "question": "Explain"},
+                    {
+                        "type": "mcq",
+                        "answer": "wrong",
+                        "answer_hash": _hash_answer("right"),
+                    },
+                ]
+            }
+        )
+    )
+    assert result["weak_areas"] == [1]
@@ -4,9 +4,35 @@ Tools Package
 Contains all tool functions used by various agents in the study buddy system.
 """
 
+from .root_agent_tools import (
+    check_understanding,
+    check_understanding_batch,
+    create_study_sections,
+    get_student_info,
+    quiz_section,
+    quiz_section_batch,
+    research_subject,
+    run_section,
+    run_sections,
+    teach_section,
+)
+from .skills import SKILL_REGISTRY, call_skill, register_skill
 from .studyplan_agent_tools import divide_into_study_sections, quick_subject_research
 
 __all__ = [
+    "SKILL_REGISTRY",
+    "call_skill",
+    "check_understanding",
+    "check_understanding_batch",
+    "create_study_sections",
     "divide_into_study_sections",
+    "get_student_info",
     "quick_subject_research",
+    "quiz_section",
+    "quiz_section_batch",
+    "register_skill",
+    "research_subject",
+    "run_section",
+    "run_sections",
+    "teach_section",
 ]
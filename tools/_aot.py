@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+AOT Kernel Build
+
+Ahead-of-time compilation of the scoring kernels with numba.pycc. The
+JIT path in tools/_kernels.py still pays the full compile on the first
+call per machine, which stalls the first student served by a fresh
+process; building the study_buddy_kernels extension at package build
+time moves that cost out of the request path.
+
+Run `python -m tools._aot` during the build to produce the extension;
+tools/_kernels.py imports it when present and falls back to JIT
+compilation otherwise.
+"""
+
+from numba.pycc import CC
+
+from ._kernels import _score_quiz_impl
+
+cc = CC("study_buddy_kernels")
+
+cc.export("score_quiz", "f4(f4[:], f4[:], f4, u1[:])")(_score_quiz_impl)
+
+
+def compile_kernels() -> None:
+    """Build the study_buddy_kernels extension module in place."""
+    cc.compile()
+
+
+if __name__ == "__main__":
+    compile_kernels()
+
+
+__all__ = ["cc", "compile_kernels"]
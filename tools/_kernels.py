@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Scoring Kernels
+
+Numba-compiled inner loops for quiz scoring. The per-student loop over
+question scores is the hot path when grading whole cohorts, so the
+arithmetic lives in a nopython kernel: weighted mean, weak-concept
+bitmask, and the threshold compare in one pass.
+
+The kernel is preferably loaded from the study_buddy_kernels extension
+built ahead of time by tools/_aot.py, which keeps JIT compilation off the
+first request entirely. When that module is absent (e.g. a source
+checkout without the build step) the same implementation is JIT-compiled
+with cache=True, so the compile cost is at least paid only once per
+machine rather than on every import.
+"""
+
+import numpy as np
+from numba import njit
+
+
+def _score_quiz_impl(
+    scores: np.ndarray,
+    weights: np.ndarray,
+    threshold: np.float32,
+    weak_out: np.ndarray,
+) -> np.float32:
+    """
+    Score one student's quiz in a single compiled pass.
+
+    Args:
+        scores: float32 array of per-question scores in [0, 1]
+        weights: float32 array of per-question weights, same length
+        threshold: score below which a question counts as a weak concept
+        weak_out: uint8 output array, same length; entry i is set to 1
+            when question i scored below the threshold
+
+    Returns:
+        Weighted mean score
+    """
+    total = np.float32(0.0)
+    weight_sum = np.float32(0.0)
+    for i in range(scores.shape[0]):
+        total += scores[i] * weights[i]
+        weight_sum += weights[i]
+        weak_out[i] = np.uint8(scores[i] < threshold)
+    return total / weight_sum if weight_sum > np.float32(0.0) else np.float32(0.0)
+
+
+try:
+    from .study_buddy_kernels import score_quiz as _score_quiz_compiled
+except ImportError:
+    _score_quiz_compiled = njit(cache=True)(_score_quiz_impl)
+
+
+def score_quiz(
+    scores: np.ndarray,
+    weights: np.ndarray,
+    threshold: np.float32,
+    weak_out: np.ndarray,
+) -> np.float32:
+    """
+    Invoke the compiled scoring kernel, falling back to pure Python.
+
+    The on-disk JIT cache records the module identity the kernel was
+    compiled under; a checkout imported both as bare ``tools`` (the test
+    suite) and package-relative (the agent stack) hits a stale cache
+    entry and raises at unpickle time. The compiled path is disabled for
+    the rest of the process on the first failure instead of crashing the
+    scoring call.
+    """
+    global _score_quiz_compiled
+    if _score_quiz_compiled is not None:
+        try:
+            return _score_quiz_compiled(scores, weights, threshold, weak_out)
+        except Exception:
+            _score_quiz_compiled = None
+    return _score_quiz_impl(scores, weights, threshold, weak_out)
+
+
+__all__ = ["score_quiz"]
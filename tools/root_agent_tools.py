@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+"""
+Root Agent Tools
+
+Tools for the main Study Buddy agent covering the full teaching loop:
+student intake, subject research, study plan creation, and the per-section
+teach/quiz/assess cycle.
+
+All tools are coroutines so the agent can dispatch independent calls
+concurrently (e.g. preparing the next section's quiz while teaching the
+current one) instead of paying for each call sequentially.
+
+The template-only tools delegate to lru_cached builders and are registered
+as solidified skills, so repeat calls with the same arguments skip both
+the formatting work and agent dispatch. Cached templates are shared
+objects; the tools hand each caller a deep copy.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import math
+from typing import Any, Optional
+
+import diskcache
+import numpy as np
+import pulp
+
+from ._kernels import score_quiz
+from .skills import register_skill
+
+# Cap on concurrent tool calls when running whole study plans in batch, so
+# the underlying LLM provider is not flooded with parallel requests.
+MAX_CONCURRENT_SECTIONS = 4
+
+# Bump to invalidate persisted research results when the curriculum
+# content changes; the version is part of the disk-cache key.
+CURRICULUM_VERSION = 1
+
+# The same (subject, grade_level) lookup recurs across students, and
+# research will become a network-bound curriculum call. Results are kept
+# in a process-local lru_cache tier over a persistent on-disk tier that
+# survives restarts; entries expire after a day.
+_RESEARCH_CACHE_TTL = 86400
+_disk_cache = diskcache.Cache("./.studybuddy_cache")
+
+
+@functools.lru_cache(maxsize=1024)
+def _student_profile_template(
+    grade_level: str, subject: str, exam_timeline: str
+) -> dict[str, Any]:
+    return {
+        "student_profile": {
+            "grade_level": grade_level,
+            "subject": subject,
+            "exam_timeline": exam_timeline,
+        },
+        "learning_preferences": [
+            "Clear explanations with examples",
+            "Practice questions after each topic",
+            "Regular understanding checks",
+        ],
+        "profile_complete": True,
+    }
+
+
+@register_skill
+async def get_student_info(
+    grade_level: str, subject: str, exam_timeline: str
+) -> dict[str, Any]:
+    """
+    Collect and confirm the student's profile before planning begins.
+
+    Args:
+        grade_level: Student's grade level (e.g., "9th grade", "AP")
+        subject: The subject the student needs help with
+        exam_timeline: How much time until the exam
+
+    Returns:
+        Dict containing the student profile used by the rest of the flow
+    """
+    return copy.deepcopy(_student_profile_template(grade_level, subject, exam_timeline))
+
+
+@functools.lru_cache(maxsize=512)
+@_disk_cache.memoize(expire=_RESEARCH_CACHE_TTL)
+def _research_template(
+    subject: str, grade_level: str, curriculum_version: int
+) -> dict[str, Any]:
+    return {
+        "subject": subject,
+        "grade_level": grade_level,
+        "key_concepts": [
+            "Foundational definitions and vocabulary",
+            "Core principles and relationships",
+            "Worked examples and applications",
+            "Problem-solving strategies",
+            "Common exam question patterns",
+        ],
+        "recommended_depth": f"Curriculum-appropriate for {grade_level} {subject}",
+        "research_complete": True,
+    }
+
+
+@register_skill
+async def research_subject(subject: str, grade_level: str) -> dict[str, Any]:
+    """
+    Research the subject to identify the key concepts to cover.
+
+    This currently returns curriculum-generic findings; it will integrate
+    with knowledge bases and curriculum standards as those become available.
+    Results are memoized per normalized (subject, grade_level) in memory
+    and on disk, so repeated lookups across students cost one call per
+    unique pair per curriculum version.
+
+    Args:
+        subject: The subject to research (e.g., "Biology", "Algebra II")
+        grade_level: Student's grade level for appropriate depth
+
+    Returns:
+        Dict containing key concepts and research findings
+    """
+    return copy.deepcopy(
+        _research_template(
+            subject.strip().lower(), grade_level.strip().lower(), CURRICULUM_VERSION
+        )
+    )
+
+
+# Hours a section would need for full mastery at perfect prior knowledge;
+# scaled up by 1/knowledge for weaker starting points.
+_BASE_HOURS_PER_SECTION = 4.0
+_MIN_HOURS_PER_SECTION = 1.0
+
+# Weight of the tie-breaking evenness term. Small enough never to outweigh
+# a real study-cost or shortfall difference; it only decides between
+# otherwise equally good allocations.
+_EVENNESS_WEIGHT = 1e-3
+
+
+def _floor_tenth(hours: float) -> float:
+    # Round down so per-section rounding can never push the total past
+    # the budget the LP enforced; the epsilon absorbs solver float noise.
+    return math.floor(hours * 10.0 + 1e-9) / 10.0
+
+
+def _allocate_study_hours(
+    knowledge_levels: tuple[float, ...], total_hours: float
+) -> list[float]:
+    """
+    Split the study-hour budget across sections with a small LP.
+
+    Each section has a mastery target of _BASE_HOURS_PER_SECTION scaled by
+    the inverse of the student's prior knowledge. The LP minimizes study
+    cost plus a per-hour shortfall penalty of 2/knowledge, so falling
+    short of a target always costs more than covering it and, when the
+    budget cannot cover everything, hours go to the weakest sections
+    first. A tiny penalty on deviation from the equal split breaks ties,
+    so identical sections get identical hours instead of whatever vertex
+    the solver lands on.
+
+    The solution is used only when the solver reports optimality. A budget
+    below the per-section floor makes the LP infeasible; that case (and
+    any solver failure) falls back to splitting the budget proportionally
+    to need.
+
+    Args:
+        knowledge_levels: Per-section prior knowledge in (0, 1]
+        total_hours: Study-hour budget until the exam
+
+    Returns:
+        Per-section allocated hours in section order, rounded down to
+        tenths so their sum never exceeds the budget
+    """
+    n = len(knowledge_levels)
+    if n == 0:
+        return []
+
+    total_hours = max(total_hours, 0.0)
+    targets = [_BASE_HOURS_PER_SECTION / p for p in knowledge_levels]
+    average = total_hours / n
+
+    prob = pulp.LpProblem("study_sections", pulp.LpMinimize)
+    x = [pulp.LpVariable(f"x{i}", lowBound=_MIN_HOURS_PER_SECTION) for i in range(n)]
+    y = [pulp.LpVariable(f"y{i}", lowBound=0.0) for i in range(n)]
+    d = [pulp.LpVariable(f"d{i}", lowBound=0.0) for i in range(n)]
+
+    prob += pulp.lpSum(
+        x[i] / knowledge_levels[i]
+        + (2.0 / knowledge_levels[i]) * y[i]
+        + _EVENNESS_WEIGHT * d[i]
+        for i in range(n)
+    )
+    prob += pulp.lpSum(x) <= total_hours
+    for i in range(n):
+        prob += y[i] >= targets[i] - x[i]
+        prob += d[i] >= x[i] - average
+        prob += d[i] >= average - x[i]
+
+    prob.solve(pulp.PULP_CBC_CMD(msg=0))
+    if prob.status != pulp.LpStatusOptimal:
+        total_need = sum(1.0 / p for p in knowledge_levels)
+        return [
+            _floor_tenth(total_hours * (1.0 / p) / total_need) for p in knowledge_levels
+        ]
+    return [_floor_tenth(var.value()) for var in x]
+
+
+@functools.lru_cache(maxsize=1024)
+def _study_sections_template(
+    subject: str,
+    key_concepts: tuple[str, ...],
+    grade_level: str,
+    total_study_hours: float,
+    knowledge_levels: tuple[float, ...],
+) -> dict[str, Any]:
+    # Build the per-section fields as parallel arrays instead of a Python
+    # loop of f-strings and dict allocations; long curricula and batch
+    # generation make the interpreter-level loop the slow part.
+    titles = np.asarray(key_concepts, dtype=str)
+    numbers = np.arange(1, titles.shape[0] + 1)
+    prerequisites = np.where(
+        numbers > 1,
+        np.char.add(
+            "Understanding of previous ",
+            np.char.add((numbers - 1).astype(str), " sections"),
+        ),
+        "Basic foundational knowledge",
+    )
+    hours = _allocate_study_hours(knowledge_levels, total_study_hours)
+
+    # Thin AoS view kept for existing consumers of "sections".
+    sections = [
+        {
+            "section_number": int(number),
+            "title": str(title),
+            "estimated_hours": allocated,
+            "prerequisites": str(prerequisite),
+            "teaching_approach": f"Grade-appropriate explanations for {grade_level}",
+            "status": "ready_for_teaching",
+        }
+        for number, title, allocated, prerequisite in zip(
+            numbers, titles, hours, prerequisites
+        )
+    ]
+
+    return {
+        "subject": subject,
+        "grade_level": grade_level,
+        "total_sections": len(sections),
+        "total_allocated_hours": round(sum(hours), 1),
+        "sections": sections,
+        "study_sections_soa": {
+            "section_number": numbers,
+            "title": titles,
+            "estimated_hours": np.asarray(hours, dtype=np.float32),
+            "prerequisites": prerequisites,
+        },
+        "plan_created": True,
+    }
+
+
+@register_skill
+async def create_study_sections(
+    subject: str,
+    key_concepts: list[str],
+    grade_level: str,
+    total_study_hours: float = 20.0,
+    knowledge_levels: Optional[list[float]] = None,
+) -> dict[str, Any]:
+    """
+    Divide the researched concepts into sequential study sections.
+
+    Per-section hours come from an LP over the study-hour budget and the
+    student's prior knowledge, so sections are rightsized to the exam
+    timeline instead of all getting the same estimate.
+
+    Args:
+        subject: The subject being studied
+        key_concepts: List of key concepts from research
+        grade_level: Student's grade level
+        total_study_hours: Study-hour budget until the exam
+        knowledge_levels: Per-concept prior knowledge in (0, 1], from the
+            student profile; defaults to 0.5 for every concept
+
+    Returns:
+        Dict containing ordered study sections ready for the teaching loop
+
+    Raises:
+        ValueError: If knowledge_levels and key_concepts differ in length
+    """
+    if knowledge_levels is None:
+        knowledge = (0.5,) * len(key_concepts)
+    else:
+        if len(knowledge_levels) != len(key_concepts):
+            raise ValueError(
+                f"knowledge_levels has {len(knowledge_levels)} entries for "
+                f"{len(key_concepts)} concepts"
+            )
+        knowledge = tuple(min(max(level, 0.1), 1.0) for level in knowledge_levels)
+
+    return copy.deepcopy(
+        _study_sections_template(
+            subject, tuple(key_concepts), grade_level, total_study_hours, knowledge
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _teaching_template(
+    section_title: str, subject: str, grade_level: str
+) -> dict[str, Any]:
+    return {
+        "section_title": section_title,
+        "teaching_content": {
+            "overview": f"Introduction to {section_title} in {subject}",
+            "explanation": (
+                f"Step-by-step explanation of {section_title}, "
+                f"pitched for {grade_level}"
+            ),
+            "examples": [
+                f"Worked example applying {section_title}",
+                f"Real-world connection for {section_title}",
+            ],
+            "key_takeaways": [
+                f"Core idea behind {section_title}",
+                f"When and how to apply {section_title}",
+            ],
+        },
+        "section_taught": True,
+    }
+
+
+@register_skill
+async def teach_section(
+    section_title: str, subject: str, grade_level: str
+) -> dict[str, Any]:
+    """
+    Teach one study section with explanations and examples.
+
+    Args:
+        section_title: Title of the section to teach
+        subject: The subject being studied
+        grade_level: Student's grade level for appropriate language
+
+    Returns:
+        Dict containing the teaching content for this section
+    """
+    return copy.deepcopy(_teaching_template(section_title, subject, grade_level))
+
+
+def _hash_answer(canonical_answer: str) -> str:
+    """Hash a normalized answer so grading compares flags, not content."""
+    return hashlib.sha256(canonical_answer.strip().lower().encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def _quiz_template(section_title: str, subject: str) -> dict[str, Any]:
+    # Structured questions carry a hash of the canonical answer so
+    # check_understanding can grade them by hash compare; only the
+    # free-text questions need LLM grading.
+    return {
+        "section_title": section_title,
+        "quiz_administered": {
+            "questions": [
+                {
+                    "question": (
+                        f"Which concept does this section of {subject} focus on?"
+                    ),
+                    "type": "mcq",
+                    "answer_hash": _hash_answer(section_title),
+                },
+                {
+                    "question": (
+                        f"True or false: {section_title} builds on the "
+                        f"previous sections of {subject}"
+                    ),
+                    "type": "mcq",
+                    "answer_hash": _hash_answer("true"),
+                },
+                {
+                    "question": (
+                        f"Explain the main idea of {section_title} " "in your own words"
+                    ),
+                    "type": "text",
+                },
+                {
+                    "question": f"Solve a practice problem using {section_title}",
+                    "type": "text",
+                },
+            ],
+            "question_count": 4,
+        },
+        "quiz_ready": True,
+    }
+
+
+@register_skill
+async def quiz_section(section_title: str, subject: str) -> dict[str, Any]:
+    """
+    Generate a short quiz testing understanding of one section.
+
+    Structured questions ship with a hash of their canonical answer so
+    check_understanding can grade them without an LLM call.
+
+    Args:
+        section_title: Title of the section to quiz on
+        subject: The subject being studied
+
+    Returns:
+        Dict containing the quiz questions for this section
+    """
+    return copy.deepcopy(_quiz_template(section_title, subject))
+
+
+# Not cached: quiz_results is a per-student dict, so calls never repeat.
+@register_skill
+async def check_understanding(quiz_results: dict[str, Any]) -> dict[str, Any]:
+    """
+    Assess quiz results and decide whether the student can move forward.
+
+    When quiz_results carries raw answers (key "answers", dicts with the
+    "type" and, for structured questions, "answer_hash" shipped by
+    quiz_section), structured answers are graded by hash compare and only
+    free-text answers without a pre-graded "score" are escalated for LLM
+    grading, reported under "needs_llm_grading". While any answer is
+    awaiting grading the verdict is marked pending ("assessment_pending")
+    and the student is not cleared to advance. Alternatively quiz_results
+    may carry already-computed per-question scores (key "per_question",
+    optionally weighted via "weights"). Either way the weighted mean and
+    weak-concept mask come from the compiled score_quiz kernel; with
+    neither key the quiz was administered conversationally and a default
+    understanding level is reported. Entries in "weak_areas" index the
+    submitted answer order.
+
+    Args:
+        quiz_results: The student's answers and scores from quiz_section
+
+    Returns:
+        Dict containing the understanding assessment and next-step decision
+
+    Raises:
+        ValueError: If "weights" and the graded scores differ in length
+    """
+    mastery_threshold = 0.7
+    needs_llm_grading: list[Any] = []
+
+    answers = quiz_results.get("answers")
+    if answers:
+        per_question = []
+        # Original answer index per graded score, so weak areas point at
+        # the submitted questions rather than the graded subset.
+        graded_indices = []
+        for index, answer in enumerate(answers):
+            if answer.get("type") == "text":
+                if "score" in answer:
+                    per_question.append(float(answer["score"]))
+                    graded_indices.append(index)
+                else:
+                    needs_llm_grading.append(answer.get("question"))
+            else:
+                per_question.append(
+                    float(
+                        _hash_answer(str(answer.get("answer", "")))
+                        == answer.get("answer_hash")
+                    )
+                )
+                graded_indices.append(index)
+    else:
+        per_question = quiz_results.get("per_question") or []
+        graded_indices = list(range(len(per_question)))
+
+    grading_pending = bool(needs_llm_grading)
+
+    if per_question:
+        raw_weights = quiz_results.get("weights")
+        # The kernel's loop indexes weights without bounds checks, and
+        # quiz_results comes from an LLM caller; reject malformed shapes
+        # before they reach compiled code.
+        if raw_weights is not None and len(raw_weights) != len(per_question):
+            raise ValueError(
+                f"weights has {len(raw_weights)} entries for "
+                f"{len(per_question)} graded scores"
+            )
+        scores = np.asarray(per_question, dtype=np.float32)
+        weights = np.asarray(
+            raw_weights if raw_weights is not None else [1.0] * len(per_question),
+            dtype=np.float32,
+        )
+        weak_out = np.zeros(scores.shape[0], dtype=np.uint8)
+        mean = score_quiz(scores, weights, np.float32(mastery_threshold), weak_out)
+        understanding_level = float(mean)
+        weak_areas = [graded_indices[i] for i in range(scores.shape[0]) if weak_out[i]]
+    elif grading_pending:
+        # Nothing graded yet; no level can be reported.
+        understanding_level = None
+        weak_areas = []
+    else:
+        understanding_level = 0.75
+        weak_areas = []
+
+    mastered = (
+        understanding_level is not None and understanding_level >= mastery_threshold
+    )
+
+    if grading_pending:
+        recommendation = "Await grading of free-text answers before deciding"
+    elif mastered:
+        recommendation = "Proceed to the next section"
+    else:
+        recommendation = "Re-teach weak areas before advancing"
+
+    return {
+        "understanding_level": understanding_level,
+        "mastery_threshold": mastery_threshold,
+        "assessment_pending": grading_pending,
+        "ready_to_advance": mastered and not grading_pending,
+        "weak_areas": weak_areas,
+        "needs_llm_grading": needs_llm_grading,
+        "recommendation": recommendation,
+    }
+
+
+async def run_section(
+    section: dict[str, Any], subject: str, grade_level: str
+) -> dict[str, Any]:
+    """
+    Run the teach and quiz preparation for one section concurrently.
+
+    Teaching content and the section quiz are independent, so preparing
+    them with asyncio.gather costs max(latency) instead of the sum.
+
+    Args:
+        section: One section dict from create_study_sections
+        subject: The subject being studied
+        grade_level: Student's grade level
+
+    Returns:
+        Dict pairing the teaching content with the prepared quiz
+    """
+    taught, quiz = await asyncio.gather(
+        teach_section(section["title"], subject, grade_level),
+        quiz_section(section["title"], subject),
+    )
+    return {
+        "section_number": section["section_number"],
+        "taught": taught,
+        "quiz": quiz,
+    }
+
+
+async def run_sections(
+    sections: list[dict[str, Any]],
+    subject: str,
+    grade_level: str,
+    max_concurrency: int = MAX_CONCURRENT_SECTIONS,
+) -> list[dict[str, Any]]:
+    """
+    Prepare every section of a study plan concurrently, capped by a semaphore.
+
+    Args:
+        sections: Section dicts from create_study_sections
+        subject: The subject being studied
+        grade_level: Student's grade level
+        max_concurrency: Maximum number of sections prepared in parallel
+
+    Returns:
+        List of per-section results in plan order
+    """
+    return await _gather_bounded(
+        (run_section(section, subject, grade_level) for section in sections),
+        max_concurrency,
+    )
+
+
+async def _gather_bounded(coros: Any, max_concurrency: int) -> list[Any]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(coro: Any) -> Any:
+        async with semaphore:
+            return await coro
+
+    return list(await asyncio.gather(*(_bounded(coro) for coro in coros)))
+
+
+@register_skill
+async def quiz_section_batch(
+    sections: list[dict[str, Any]],
+    subject: str,
+    max_concurrency: int = MAX_CONCURRENT_SECTIONS,
+) -> dict[str, Any]:
+    """
+    Generate quizzes for a whole cohort of sections in one call.
+
+    Quizzes are currently templates, so the batch runs the scalar tool
+    concurrently under a semaphore sized to provider rate limits. Once
+    quiz generation is LLM-backed, this is the seam where a single
+    provider batch request (one JSONL payload, polled to completion)
+    replaces the gather for cohorts that can tolerate batch turnaround.
+
+    Args:
+        sections: Section dicts from create_study_sections
+        subject: The subject being studied
+        max_concurrency: Maximum number of quizzes generated in parallel
+
+    Returns:
+        Dict containing the generated quizzes in section order
+    """
+    quizzes = await _gather_bounded(
+        (quiz_section(section["title"], subject) for section in sections),
+        max_concurrency,
+    )
+    return {
+        "quizzes": quizzes,
+        "batch_size": len(quizzes),
+        "batch_complete": True,
+    }
+
+
+@register_skill
+async def check_understanding_batch(
+    results: list[dict[str, Any]],
+    max_concurrency: int = MAX_CONCURRENT_SECTIONS,
+) -> dict[str, Any]:
+    """
+    Assess quiz results for a whole cohort of students in one call.
+
+    Latency is bounded by the slowest assessment in the batch rather than
+    the sum of sequential per-student calls.
+
+    Args:
+        results: One quiz_results dict per student, as accepted by
+            check_understanding
+        max_concurrency: Maximum number of assessments run in parallel
+
+    Returns:
+        Dict containing per-student assessments plus cohort-level summary
+        statistics
+    """
+    assessments = await _gather_bounded(
+        (check_understanding(result) for result in results), max_concurrency
+    )
+    # Pending assessments carry no level yet; summarize the graded ones.
+    levels = [
+        assessment["understanding_level"]
+        for assessment in assessments
+        if assessment["understanding_level"] is not None
+    ]
+    return {
+        "assessments": assessments,
+        "cohort_size": len(assessments),
+        "cohort_mean_understanding": float(np.mean(levels)) if levels else 0.0,
+        "ready_to_advance_count": sum(
+            assessment["ready_to_advance"] for assessment in assessments
+        ),
+        "batch_complete": True,
+    }
+
+
+__all__ = [
+    "CURRICULUM_VERSION",
+    "MAX_CONCURRENT_SECTIONS",
+    "check_understanding",
+    "check_understanding_batch",
+    "create_study_sections",
+    "get_student_info",
+    "quiz_section",
+    "quiz_section_batch",
+    "research_subject",
+    "run_section",
+    "run_sections",
+    "teach_section",
+]
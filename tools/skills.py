@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Skill Registry
+
+Tools whose bodies are pure templates need no LLM involvement at all:
+once their signatures are known they can be called as plain functions.
+This module keeps a registry mapping tool names to their solidified
+implementations so callers (the compiled plan, batch runners) can bypass
+agent dispatch entirely, with a validation hook that re-routes to a
+fallback path when a cached result fails a downstream check.
+"""
+
+import inspect
+from typing import Any, Awaitable, Callable, Optional
+
+# Tool name -> solidified coroutine function. Populated by register_skill
+# at import time of the tool modules.
+SKILL_REGISTRY: dict[str, Callable[..., Awaitable[Any]]] = {}
+
+# Tool name -> signature string, recorded so callers can verify a skill
+# still matches the call they were compiled against.
+SKILL_SIGNATURES: dict[str, str] = {}
+
+
+def register_skill(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Register a tool as a solidified skill, keyed by its name.
+
+    Args:
+        fn: The coroutine tool function to register
+
+    Returns:
+        The function unchanged, so this can be used as a decorator
+    """
+    SKILL_REGISTRY[fn.__name__] = fn
+    SKILL_SIGNATURES[fn.__name__] = str(inspect.signature(fn))
+    return fn
+
+
+async def call_skill(
+    name: str,
+    *args: Any,
+    validate: Optional[Callable[[Any], bool]] = None,
+    fallback: Optional[Callable[..., Awaitable[Any]]] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call a solidified skill directly, skipping agent dispatch.
+
+    Args:
+        name: Registered skill name
+        validate: Optional check on the result; a failing result re-routes
+            the call to the fallback instead of being returned
+        fallback: Coroutine to use when the skill is missing or its result
+            fails validation (e.g. the LLM-backed path)
+
+    Returns:
+        The skill result, or the fallback result when validation fails
+
+    Raises:
+        KeyError: If the skill is unregistered and no fallback is given
+    """
+    skill = SKILL_REGISTRY.get(name)
+    if skill is None:
+        if fallback is None:
+            raise KeyError(f"No solidified skill registered for '{name}'")
+        return await fallback(*args, **kwargs)
+
+    result = await skill(*args, **kwargs)
+    if validate is not None and not validate(result):
+        if fallback is None:
+            raise ValueError(f"Skill '{name}' result failed validation")
+        return await fallback(*args, **kwargs)
+    return result
+
+
+__all__ = ["SKILL_REGISTRY", "SKILL_SIGNATURES", "call_skill", "register_skill"]